@@ -1,432 +1,708 @@
-import pandas as pd
+import logging
+import os
+import queue
 import boto3
-from botocore.exceptions import NoCredentialsError, NoRegionError, ClientError
+import xlsxwriter
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, NoCredentialsError, NoRegionError, ClientError
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache, partial
+
+log = logging.getLogger(__name__)
+
+# All collectors share one session so credentials are only resolved once.
+SESSION = boto3.Session()
+
+# Log a line for every resource processed, not just the per-region summaries.
+VERBOSE = False
+
+# Regional scans are network-bound, so fan them out over a thread pool and
+# give each client a connection pool large enough for the concurrent calls.
+# Keep-alive lets repeated calls to the same endpoint reuse their TLS session.
+MAX_WORKERS = 16
+LAMBDA_URL_WORKERS = 32
+API_STAGE_WORKERS = 16
+CLIENT_CONFIG = Config(
+    tcp_keepalive=True,
+    max_pool_connections=50,
+    retries={'mode': 'adaptive', 'max_attempts': 10},
+)
+# Per-region clients give up quickly so regions that are unreachable or
+# refuse the credentials don't hold a scan up through a long retry backoff.
+# None of the scanned APIs use endpoint discovery; disabling it only keeps a
+# future addition from quietly adding a lookup call per client.
+REGIONAL_CLIENT_CONFIG = CLIENT_CONFIG.merge(Config(
+    connect_timeout=3,
+    read_timeout=10,
+    retries={'mode': 'adaptive', 'max_attempts': 2},
+    endpoint_discovery_enabled=False,
+))
+# Clients that fire many concurrent per-resource calls at one regional
+# endpoint are throttled well before the region is in doubt (the listing
+# call already proved it reachable), so they keep the fast timeouts but
+# retry throttling as patiently as the global clients.
+PER_RESOURCE_CLIENT_CONFIG = REGIONAL_CLIENT_CONFIG.merge(Config(
+    retries={'mode': 'adaptive', 'max_attempts': 10},
+))
+
+# Only scan the regions where the Resource Groups Tagging API reports a
+# resource of the collector's type. The tagging API only sees resources that
+# carry (or once carried) a tag, so this can miss untagged resources.
+TAGGED_REGIONS_ONLY = False
+TAGGED_RESOURCE_TYPES = {
+    'apigateway': 'apigateway',
+    'lambda': 'lambda:function',
+    'appsync': 'appsync',
+    'amplify': 'amplify',
+    'elbv2': 'elasticloadbalancing:loadbalancer',
+    'rds': 'rds:db',
+    'ec2': 'ec2:instance',
+}
+
+@lru_cache(maxsize=None)
+def get_available_regions(service):
+    # Looking regions up parses botocore's endpoint data, so do it once per service.
+    return tuple(SESSION.get_available_regions(service))
+
+@lru_cache(maxsize=None)
+def get_enabled_regions():
+    # Regions the account has not opted into still cost a full TLS handshake
+    # before failing, so only scan the ones that are enabled.
+    try:
+        client = SESSION.client('account', config=CLIENT_CONFIG)
+        pages = client.get_paginator('list_regions').paginate(RegionOptStatusContains=['ENABLED', 'ENABLED_BY_DEFAULT'])
+        return frozenset(region['RegionName'] for page in pages for region in page['Regions'])
+    except Exception as e:
+        log.warning("Unable to list enabled regions with the Account API: %s", e)
 
-def get_aws_account_id():
     try:
-        sts_client = boto3.client('sts')
-        identity = sts_client.get_caller_identity()
+        client = SESSION.client('ec2', config=CLIENT_CONFIG)
+        response = client.describe_regions(AllRegions=False)
+        return frozenset(region['RegionName'] for region in response['Regions'])
+    except Exception as e:
+        log.warning("Unable to list enabled regions, scanning all regions: %s", e)
+        return None
+
+@lru_cache(maxsize=None)
+def get_tagged_regions():
+    arn_services = {resource_type.split(':')[0]: service for service, resource_type in TAGGED_RESOURCE_TYPES.items()}
+    resource_types = list(TAGGED_RESOURCE_TYPES.values())
+
+    def scan_region(region):
+        try:
+            client = SESSION.client('resourcegroupstaggingapi', region_name=region, config=REGIONAL_CLIENT_CONFIG)
+            services = set()
+            for page in client.get_paginator('get_resources').paginate(ResourceTypeFilters=resource_types):
+                for resource in page['ResourceTagMappingList']:
+                    service = arn_services.get(resource['ResourceARN'].split(':')[2])
+                    if service is None:
+                        log.warning("Unrecognised tagged resource %s in region %s", resource['ResourceARN'], region)
+                        return set(TAGGED_RESOURCE_TYPES)
+                    services.add(service)
+            return services
+        except (ClientError, BotoCoreError) as e:
+            # Scan every service in a region the tagging API can't answer for.
+            log.warning("Unable to list tagged resources in region %s: %s", region, e)
+            return set(TAGGED_RESOURCE_TYPES)
+
+    regions = get_available_regions('resourcegroupstaggingapi')
+    enabled_regions = get_enabled_regions()
+    if enabled_regions is not None:
+        regions = [region for region in regions if region in enabled_regions]
+
+    tagged_regions = {service: set() for service in TAGGED_RESOURCE_TYPES}
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        for region, services in zip(regions, executor.map(scan_region, regions)):
+            for service in services:
+                tagged_regions[service].add(region)
+    return tagged_regions
+
+def scan_regions(service, scan_region):
+    regions = get_available_regions(service)
+    enabled_regions = get_enabled_regions()
+    if enabled_regions is not None:
+        regions = [region for region in regions if region in enabled_regions]
+    if TAGGED_REGIONS_ONLY:
+        tagged_regions = get_tagged_regions()[service]
+        regions = [region for region in regions if region in tagged_regions]
+
+    def scan_one_region(region):
+        # The workers log API and connection errors themselves and keep the rows
+        # they already have; anything unexpected lands here so it only costs the
+        # region it happened in. Missing credentials affect every region, so let
+        # the collector report them once.
+        try:
+            return scan_region(region)
+        except NoCredentialsError:
+            raise
+        except Exception as e:
+            log.warning("Error scanning %s in region %s: %s", service, region, e)
+            return {}
+
+    # Each region returns its rows column by column; stitch the columns together.
+    columns = {}
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        for region_columns in executor.map(scan_one_region, regions):
+            for column, values in region_columns.items():
+                columns.setdefault(column, []).extend(values)
+    return columns
+
+@lru_cache(maxsize=None)
+def get_caller_identity(session=SESSION):
+    # A failed lookup raises instead of returning, so only successes are cached.
+    sts_client = session.client('sts', config=CLIENT_CONFIG)
+    return sts_client.get_caller_identity()
+
+def get_aws_account_id(session=SESSION):
+    try:
+        identity = get_caller_identity(session)
         return identity['Account']
     except Exception as e:
-        print(f"Unable to get AWS account ID: {e}")
+        log.error("Unable to get AWS account ID: %s", e)
         return None
 
 def list_route53_records(account_id):
-    records_data = []
+    zone_names, record_names, record_types, record_values = [], [], [], []
     try:
-        session = boto3.Session()
-        client = session.client('route53')
-
-        hosted_zones_response = client.list_hosted_zones()
-        hosted_zones = hosted_zones_response['HostedZones']
-
-        for zone in hosted_zones:
-            zone_id = zone['Id'].split('/')[-1]
-            zone_name = zone['Name']
-
-            next_record_name = None
-            next_record_type = None
-            is_truncated = True
-
-            while is_truncated:
-                if next_record_name and next_record_type:
-                    record_sets_response = client.list_resource_record_sets(
-                        HostedZoneId=zone_id,
-                        StartRecordName=next_record_name,
-                        StartRecordType=next_record_type
-                    )
-                else:
-                    record_sets_response = client.list_resource_record_sets(HostedZoneId=zone_id)
-                
-                record_sets = record_sets_response['ResourceRecordSets']
-
-                for record in record_sets:
-                    record_name = record['Name']
-                    record_type = record['Type']
-
-                    if 'ResourceRecords' in record:
-                        record_values = ', '.join([r['Value'] for r in record['ResourceRecords']])
-                    elif 'AliasTarget' in record:
-                        record_values = record['AliasTarget']['DNSName']
-                    else:
-                        record_values = 'N/A'
-
-                    records_data.append([account_id, zone_name, record_name, record_type, record_values])
-
-                is_truncated = record_sets_response['IsTruncated']
-                if is_truncated:
-                    next_record_name = record_sets_response['NextRecordName']
-                    next_record_type = record_sets_response['NextRecordType']
+        client = SESSION.client('route53', config=CLIENT_CONFIG)
+
+        zone_paginator = client.get_paginator('list_hosted_zones')
+        record_paginator = client.get_paginator('list_resource_record_sets')
+
+        for zone_page in zone_paginator.paginate():
+            for zone in zone_page['HostedZones']:
+                zone_id = zone['Id'].split('/')[-1]
+                zone_name = zone['Name']
+
+                # 300 is the largest page list_resource_record_sets will return.
+                record_pages = record_paginator.paginate(HostedZoneId=zone_id, PaginationConfig={'PageSize': 300})
+                for record_page in record_pages:
+                    for record in record_page['ResourceRecordSets']:
+                        resource_records = record.get('ResourceRecords')
+                        alias_target = record.get('AliasTarget')
+
+                        if resource_records:
+                            record_value = ', '.join(r['Value'] for r in resource_records)
+                        elif alias_target:
+                            record_value = alias_target['DNSName']
+                        else:
+                            record_value = 'N/A'
+
+                        zone_names.append(zone_name)
+                        record_names.append(record['Name'])
+                        record_types.append(record['Type'])
+                        record_values.append(record_value)
 
     except NoCredentialsError:
-        print("No AWS credentials found. Please configure your AWS credentials.")
+        log.error("No AWS credentials found. Please configure your AWS credentials.")
     except ClientError as e:
-        print(f"An error occurred: {e}")
+        log.error("An error occurred: %s", e)
     except Exception as e:
-        print(f"An error occurred: {e}")
+        log.error("An error occurred: %s", e)
 
-    return records_data
+    return {
+        'Account ID': [account_id] * len(record_names),
+        'Hosted Zone': zone_names,
+        'Domain': record_names,
+        'Record Type': record_types,
+        'Record Value': record_values,
+    }
 
-def get_api_gateway_endpoints(account_id):
-    endpoints_data = []
+def get_api_stages(client, region, api_id):
     try:
-        session = boto3.Session()
-        regions = session.get_available_regions('apigateway')
+        return client.get_stages(restApiId=api_id)['item']
+    except (ClientError, BotoCoreError) as e:
+        log.warning("Error getting stages for API %s in region %s: %s", api_id, region, e)
+        return []
 
-        for region in regions:
+def get_api_gateway_endpoints(account_id):
+    endpoints_data = {}
+    try:
+        def scan_region(region):
+            api_names, api_ids, stage_names, invoke_urls = [], [], [], []
             try:
-                client = session.client('apigateway', region_name=region)
-                response = client.get_rest_apis()
-                apis = response['items']
-                
+                client = SESSION.client('apigateway', region_name=region, config=REGIONAL_CLIENT_CONFIG)
+                # 500 is the largest page get_rest_apis will return.
+                rest_api_pages = client.get_paginator('get_rest_apis').paginate(PaginationConfig={'PageSize': 500})
+                apis = [api for page in rest_api_pages for api in page['items']]
+
+                # get_stages is not paginated and has no multi-API form, so fetch each API's stages concurrently
                 if apis:
-                    for api in apis:
-                        api_id = api['id']
-                        api_name = api['name']
-                        
-                        stages_response = client.get_stages(restApiId=api_id)
-                        stages = stages_response['item']
-                        
-                        if stages:
-                            for stage in stages:
-                                stage_name = stage['stageName']
-                                invoke_url = f"https://{api_id}.execute-api.{region}.amazonaws.com/{stage_name}"
-                                endpoints_data.append([account_id, region, api_name, api_id, stage_name, invoke_url])
-            
-            except client.exceptions.ClientError:
-                continue
+                    stages_client = SESSION.client('apigateway', region_name=region, config=PER_RESOURCE_CLIENT_CONFIG)
+                    with ThreadPoolExecutor(max_workers=API_STAGE_WORKERS) as executor:
+                        api_stages = executor.map(lambda api: get_api_stages(stages_client, region, api['id']), apis)
+
+                        for api, stages in zip(apis, api_stages):
+                            api_id = api['id']
+                            api_name = api['name']
+
+                            if stages:
+                                for stage in stages:
+                                    stage_name = stage['stageName']
+                                    invoke_url = f"https://{api_id}.execute-api.{region}.amazonaws.com/{stage_name}"
+                                    api_names.append(api_name)
+                                    api_ids.append(api_id)
+                                    stage_names.append(stage_name)
+                                    invoke_urls.append(invoke_url)
+
+                log.info("Found %d API Gateway stages in region %s", len(api_ids), region)
+            except NoCredentialsError:
+                raise
+            except (ClientError, BotoCoreError) as e:
+                log.warning("Error listing API Gateway APIs in region %s: %s", region, e)
+
+            return {
+                'Account ID': [account_id] * len(api_ids),
+                'Region': [region] * len(api_ids),
+                'API Name': api_names,
+                'API ID': api_ids,
+                'Stage': stage_names,
+                'Invoke URL': invoke_urls,
+            }
+
+        endpoints_data = scan_regions('apigateway', scan_region)
     
     except NoRegionError:
-        print("No region found. Please configure your AWS region.")
+        log.error("No region found. Please configure your AWS region.")
     except NoCredentialsError:
-        print("No AWS credentials found. Please configure your AWS credentials.")
+        log.error("No AWS credentials found. Please configure your AWS credentials.")
     except Exception as e:
-        print(f"An error occurred: {e}")
+        log.error("An error occurred: %s", e)
 
     return endpoints_data
 
-def get_lambda_functions(account_id):
-    lambda_data = []
+def get_function_url(client, region, function_name):
     try:
-        session = boto3.Session()
-        regions = session.get_available_regions('lambda')
+        url_config = client.get_function_url_config(FunctionName=function_name)
+        return url_config['FunctionUrl']
+    except client.exceptions.ResourceNotFoundException:
+        return 'N/A'
+    except client.exceptions.AccessDeniedException as e:
+        log.warning("Access denied for function %s in region %s: %s", function_name, region, e)
+        return 'AccessDenied'
+    except (ClientError, BotoCoreError) as e:
+        log.warning("Error getting URL for function %s in region %s: %s", function_name, region, e)
+        return 'Error'
 
-        for region in regions:
-            print(f"Processing region: {region}")
+def get_lambda_functions(account_id):
+    lambda_data = {}
+    try:
+        def scan_region(region):
+            url_function_names, function_urls = [], []
             try:
-                client = session.client('lambda', region_name=region)
-                next_marker = None
-                while True:
-                    if next_marker:
-                        response = client.list_functions(Marker=next_marker)
-                    else:
-                        response = client.list_functions()
-                    
-                    functions = response['Functions']
-                    print(f"Found {len(functions)} functions in region {region}")
-
-                    for function in functions:
-                        function_name = function['FunctionName']
-                        
-                        # Get function configuration to retrieve the function URL
-                        try:
-                            url_config = client.get_function_url_config(FunctionName=function_name)
-                            function_url = url_config['FunctionUrl']
-                        except client.exceptions.ResourceNotFoundException:
-                            function_url = 'N/A'
-                        except client.exceptions.AccessDeniedException as e:
-                            print(f"Access denied for function {function_name} in region {region}: {e}")
-                            function_url = 'AccessDenied'
-                        except ClientError as e:
-                            print(f"Error getting URL for function {function_name} in region {region}: {e}")
-                            function_url = 'Error'
-                        
-                        if function_url not in ['N/A', 'AccessDenied', 'Error']:
-                            lambda_data.append([account_id, region, function_name, function_url])
-                            print(f"Processed function: {function_name} in region {region}, URL: {function_url}")
-                    
-                    next_marker = response.get('NextMarker')
-                    if not next_marker:
-                        break
-            
-            except ClientError as e:
-                print(f"Error listing functions in region {region}: {e}")
-    
+                client = SESSION.client('lambda', region_name=region, config=REGIONAL_CLIENT_CONFIG)
+                function_names = []
+                for page in client.get_paginator('list_functions').paginate():
+                    function_names.extend(function['FunctionName'] for function in page['Functions'])
+
+                # Function URLs can only be looked up one function at a time, so probe them concurrently
+                if function_names:
+                    url_client = SESSION.client('lambda', region_name=region, config=PER_RESOURCE_CLIENT_CONFIG)
+                    with ThreadPoolExecutor(max_workers=LAMBDA_URL_WORKERS) as executor:
+                        urls = executor.map(lambda name: get_function_url(url_client, region, name), function_names)
+
+                        for function_name, function_url in zip(function_names, urls):
+                            if function_url not in ['N/A', 'AccessDenied', 'Error']:
+                                url_function_names.append(function_name)
+                                function_urls.append(function_url)
+                                log.debug("Processed function: %s in region %s, URL: %s", function_name, region, function_url)
+
+                log.info("Found %d functions in region %s, %d with a function URL", len(function_names), region, len(function_urls))
+
+            except NoCredentialsError:
+                raise
+            except (ClientError, BotoCoreError) as e:
+                log.warning("Error listing functions in region %s: %s", region, e)
+
+            return {
+                'Account ID': [account_id] * len(url_function_names),
+                'Region': [region] * len(url_function_names),
+                'Function Name': url_function_names,
+                'Function URL': function_urls,
+            }
+
+        lambda_data = scan_regions('lambda', scan_region)
+
     except NoRegionError:
-        print("No region found. Please configure your AWS region.")
+        log.error("No region found. Please configure your AWS region.")
     except NoCredentialsError:
-        print("No AWS credentials found. Please configure your AWS credentials.")
+        log.error("No AWS credentials found. Please configure your AWS credentials.")
     except Exception as e:
-        print(f"An error occurred: {e}")
+        log.error("An error occurred: %s", e)
 
     return lambda_data
 
 def get_appsync_endpoints(account_id):
-    appsync_data = []
+    appsync_data = {}
     try:
-        session = boto3.Session()
-        regions = session.get_available_regions('appsync')
-
-        for region in regions:
-            print(f"Processing region: {region}")
+        def scan_region(region):
+            api_names, api_urls = [], []
             try:
-                client = session.client('appsync', region_name=region)
-                response = client.list_graphql_apis()
-                graphql_apis = response['graphqlApis']
-                print(f"Found {len(graphql_apis)} GraphQL APIs in region {region}")
-
-                for api in graphql_apis:
-                    api_name = api['name']
-                    api_url = api['uris'].get('GRAPHQL')
-
-                    if api_url:
-                        appsync_data.append([account_id, region, api_name, api_url])
-                        print(f"Processed GraphQL API: {api_name} in region {region}, URL: {api_url}")
-            
-            except ClientError as e:
-                print(f"Error listing GraphQL APIs in region {region}: {e}")
-    
+                client = SESSION.client('appsync', region_name=region, config=REGIONAL_CLIENT_CONFIG)
+                for page in client.get_paginator('list_graphql_apis').paginate():
+                    for api in page['graphqlApis']:
+                        api_name = api['name']
+                        api_url = api['uris'].get('GRAPHQL')
+
+                        if api_url:
+                            api_names.append(api_name)
+                            api_urls.append(api_url)
+                            log.debug("Processed GraphQL API: %s in region %s, URL: %s", api_name, region, api_url)
+
+                log.info("Found %d GraphQL APIs in region %s", len(api_names), region)
+
+            except NoCredentialsError:
+                raise
+            except (ClientError, BotoCoreError) as e:
+                log.warning("Error listing GraphQL APIs in region %s: %s", region, e)
+
+            return {
+                'Account ID': [account_id] * len(api_names),
+                'Region': [region] * len(api_names),
+                'API Name': api_names,
+                'API URL': api_urls,
+            }
+
+        appsync_data = scan_regions('appsync', scan_region)
+
     except NoRegionError:
-        print("No region found. Please configure your AWS region.")
+        log.error("No region found. Please configure your AWS region.")
     except NoCredentialsError:
-        print("No AWS credentials found. Please configure your AWS credentials.")
+        log.error("No AWS credentials found. Please configure your AWS credentials.")
     except Exception as e:
-        print(f"An error occurred: {e}")
+        log.error("An error occurred: %s", e)
 
     return appsync_data
 
 def get_cloudfront_endpoints(account_id):
-    cloudfront_data = []
+    dist_ids, dist_names, dist_domains, alternate_domain_names = [], [], [], []
     try:
-        session = boto3.Session()
-        client = session.client('cloudfront')
+        client = SESSION.client('cloudfront', config=CLIENT_CONFIG)
 
-        response = client.list_distributions()
-        distributions = response['DistributionList'].get('Items', [])
-        print(f"Found {len(distributions)} distributions")
+        for page in client.get_paginator('list_distributions').paginate():
+            distributions = page['DistributionList'].get('Items', [])
 
-        for dist in distributions:
-            dist_id = dist['Id']
-            dist_domain = dist['DomainName']
-            dist_name = dist['Origins']['Items'][0]['Id']
-            alternate_domain_names = ', '.join(dist.get('Aliases', {}).get('Items', []))
+            page_ids = [dist['Id'] for dist in distributions]
+            page_names = [dist['Origins']['Items'][0]['Id'] for dist in distributions]
+            page_domains = [dist['DomainName'] for dist in distributions]
+            page_aliases = [', '.join(dist.get('Aliases', {}).get('Items', [])) for dist in distributions]
+
+            dist_ids.extend(page_ids)
+            dist_names.extend(page_names)
+            dist_domains.extend(page_domains)
+            alternate_domain_names.extend(page_aliases)
+
+            if log.isEnabledFor(logging.DEBUG):
+                for dist_name, dist_domain, aliases in zip(page_names, page_domains, page_aliases):
+                    log.debug("Processed distribution: %s, Domain: %s, Aliases: %s", dist_name, dist_domain, aliases)
+
+        log.info("Found %d distributions", len(dist_ids))
 
-            cloudfront_data.append([account_id, dist_id, dist_name, dist_domain, alternate_domain_names])
-            print(f"Processed distribution: {dist_name}, Domain: {dist_domain}, Aliases: {alternate_domain_names}")
-    
     except NoCredentialsError:
-        print("No AWS credentials found. Please configure your AWS credentials.")
+        log.error("No AWS credentials found. Please configure your AWS credentials.")
     except ClientError as e:
-        print(f"An error occurred: {e}")
+        log.error("An error occurred: %s", e)
     except Exception as e:
-        print(f"An error occurred: {e}")
+        log.error("An error occurred: %s", e)
 
-    return cloudfront_data
+    return {
+        'Account ID': [account_id] * len(dist_ids),
+        'Distribution ID': dist_ids,
+        'Distribution Name': dist_names,
+        'Domain Name': dist_domains,
+        'Alternate Domain Names': alternate_domain_names,
+    }
 
 
 def get_amplify_endpoints(account_id):
-    amplify_data = []
+    amplify_data = {}
     try:
-        session = boto3.Session()
-        regions = session.get_available_regions('amplify')
-
-        for region in regions:
-            print(f"Processing region: {region}")
+        def scan_region(region):
+            app_ids, app_names, branch_names, branch_urls = [], [], [], []
             try:
-                client = session.client('amplify', region_name=region)
-                response = client.list_apps()
-                apps = response['apps']
-                print(f"Found {len(apps)} apps in region {region}")
-
-                for app in apps:
-                    app_id = app['appId']
-                    app_name = app['name']
-                    default_domain = app.get('defaultDomain', 'N/A')
-
-                    # List branches for the app to get full URLs
-                    branch_response = client.list_branches(appId=app_id)
-                    branches = branch_response['branches']
-
-                    for branch in branches:
-                        branch_name = branch['branchName']
-                        branch_url = f"https://{branch_name}.{default_domain}"
-
-                        amplify_data.append([account_id, region, app_id, app_name, branch_name, branch_url])
-                        print(f"Processed app: {app_name} in region {region}, Branch: {branch_name}, URL: {branch_url}")
-            
-            except ClientError as e:
-                print(f"Error listing apps in region {region}: {e}")
-    
+                client = SESSION.client('amplify', region_name=region, config=REGIONAL_CLIENT_CONFIG)
+                for page in client.get_paginator('list_apps').paginate():
+                    for app in page['apps']:
+                        app_id = app['appId']
+                        app_name = app['name']
+                        default_domain = app.get('defaultDomain', 'N/A')
+
+                        # List branches for the app to get full URLs
+                        for branch_page in client.get_paginator('list_branches').paginate(appId=app_id):
+                            for branch in branch_page['branches']:
+                                branch_name = branch['branchName']
+                                branch_url = f"https://{branch_name}.{default_domain}"
+
+                                app_ids.append(app_id)
+                                app_names.append(app_name)
+                                branch_names.append(branch_name)
+                                branch_urls.append(branch_url)
+                                log.debug("Processed app: %s in region %s, Branch: %s, URL: %s", app_name, region, branch_name, branch_url)
+
+                log.info("Found %d Amplify branches in region %s", len(branch_names), region)
+
+            except NoCredentialsError:
+                raise
+            except (ClientError, BotoCoreError) as e:
+                log.warning("Error listing apps in region %s: %s", region, e)
+
+            return {
+                'Account ID': [account_id] * len(app_ids),
+                'Region': [region] * len(app_ids),
+                'App ID': app_ids,
+                'App Name': app_names,
+                'Branch Name': branch_names,
+                'Branch URL': branch_urls,
+            }
+
+        amplify_data = scan_regions('amplify', scan_region)
+
     except NoRegionError:
-        print("No region found. Please configure your AWS region.")
+        log.error("No region found. Please configure your AWS region.")
     except NoCredentialsError:
-        print("No AWS credentials found. Please configure your AWS credentials.")
+        log.error("No AWS credentials found. Please configure your AWS credentials.")
     except Exception as e:
-        print(f"An error occurred: {e}")
+        log.error("An error occurred: %s", e)
 
     return amplify_data
 
 
 
 def get_elb_endpoints(account_id):
-    elb_data = []
+    elb_data = {}
     try:
-        session = boto3.Session()
-        regions = session.get_available_regions('elbv2')
-
-        for region in regions:
-            print(f"Processing region: {region}")
+        def scan_region(region):
+            lb_names, lb_dns_names = [], []
             try:
-                client = session.client('elbv2', region_name=region)
-                response = client.describe_load_balancers()
-                load_balancers = response['LoadBalancers']
-                print(f"Found {len(load_balancers)} load balancers in region {region}")
-
-                for lb in load_balancers:
-                    lb_name = lb['LoadBalancerName']
-                    lb_dns = lb['DNSName']
-
-                    elb_data.append([account_id, region, lb_name, lb_dns])
-                    print(f"Processed load balancer: {lb_name} in region {region}, DNS: {lb_dns}")
-            
-            except ClientError as e:
-                print(f"Error listing load balancers in region {region}: {e}")
-    
+                client = SESSION.client('elbv2', region_name=region, config=REGIONAL_CLIENT_CONFIG)
+                # 400 is the largest page describe_load_balancers will return.
+                for page in client.get_paginator('describe_load_balancers').paginate(PaginationConfig={'PageSize': 400}):
+                    for lb in page['LoadBalancers']:
+                        lb_name = lb['LoadBalancerName']
+                        lb_dns = lb['DNSName']
+
+                        lb_names.append(lb_name)
+                        lb_dns_names.append(lb_dns)
+                        log.debug("Processed load balancer: %s in region %s, DNS: %s", lb_name, region, lb_dns)
+
+                log.info("Found %d load balancers in region %s", len(lb_names), region)
+
+            except NoCredentialsError:
+                raise
+            except (ClientError, BotoCoreError) as e:
+                log.warning("Error listing load balancers in region %s: %s", region, e)
+
+            return {
+                'Account ID': [account_id] * len(lb_names),
+                'Region': [region] * len(lb_names),
+                'Load Balancer Name': lb_names,
+                'DNS Name': lb_dns_names,
+            }
+
+        elb_data = scan_regions('elbv2', scan_region)
+
     except NoRegionError:
-        print("No region found. Please configure your AWS region.")
+        log.error("No region found. Please configure your AWS region.")
     except NoCredentialsError:
-        print("No AWS credentials found. Please configure your AWS credentials.")
+        log.error("No AWS credentials found. Please configure your AWS credentials.")
     except Exception as e:
-        print(f"An error occurred: {e}")
+        log.error("An error occurred: %s", e)
 
     return elb_data
 
 
 def get_rds_endpoints(account_id):
-    rds_data = []
+    rds_data = {}
     try:
-        session = boto3.Session()
-        regions = session.get_available_regions('rds')
-
-        for region in regions:
-            print(f"Processing region: {region}")
+        def scan_region(region):
+            db_instance_ids, db_endpoints = [], []
             try:
-                client = session.client('rds', region_name=region)
-                response = client.describe_db_instances()
-                db_instances = response['DBInstances']
-                print(f"Found {len(db_instances)} RDS instances in region {region}")
-
-                for db_instance in db_instances:
-                    db_instance_id = db_instance['DBInstanceIdentifier']
-                    db_endpoint = db_instance['Endpoint']['Address']
-
-                    rds_data.append([account_id, region, db_instance_id, db_endpoint])
-                    print(f"Processed RDS instance: {db_instance_id} in region {region}, Endpoint: {db_endpoint}")
-            
-            except ClientError as e:
-                print(f"Error listing RDS instances in region {region}: {e}")
-    
+                client = SESSION.client('rds', region_name=region, config=REGIONAL_CLIENT_CONFIG)
+                # 100 is both the default and the maximum MaxRecords; set it
+                # explicitly so the page size doesn't depend on the default.
+                for page in client.get_paginator('describe_db_instances').paginate(PaginationConfig={'PageSize': 100}):
+                    for db_instance in page['DBInstances']:
+                        db_instance_id = db_instance['DBInstanceIdentifier']
+                        # Instances that are still being created have no endpoint yet.
+                        db_endpoint = db_instance.get('Endpoint', {}).get('Address', 'N/A')
+
+                        db_instance_ids.append(db_instance_id)
+                        db_endpoints.append(db_endpoint)
+                        log.debug("Processed RDS instance: %s in region %s, Endpoint: %s", db_instance_id, region, db_endpoint)
+
+                log.info("Found %d RDS instances in region %s", len(db_instance_ids), region)
+
+            except NoCredentialsError:
+                raise
+            except (ClientError, BotoCoreError) as e:
+                log.warning("Error listing RDS instances in region %s: %s", region, e)
+
+            return {
+                'Account ID': [account_id] * len(db_instance_ids),
+                'Region': [region] * len(db_instance_ids),
+                'DB Instance ID': db_instance_ids,
+                'Endpoint': db_endpoints,
+            }
+
+        rds_data = scan_regions('rds', scan_region)
+
     except NoRegionError:
-        print("No region found. Please configure your AWS region.")
+        log.error("No region found. Please configure your AWS region.")
     except NoCredentialsError:
-        print("No AWS credentials found. Please configure your AWS credentials.")
+        log.error("No AWS credentials found. Please configure your AWS credentials.")
     except Exception as e:
-        print(f"An error occurred: {e}")
+        log.error("An error occurred: %s", e)
 
     return rds_data
 
 def get_ec2_endpoints(account_id):
-    ec2_data = []
+    ec2_data = {}
     try:
-        session = boto3.Session()
-        regions = session.get_available_regions('ec2')
-
-        for region in regions:
-            print(f"Processing region: {region}")
+        def scan_region(region):
+            instance_ids, public_ips, public_dns_names = [], [], []
             try:
-                client = session.client('ec2', region_name=region)
-                response = client.describe_instances()
-                reservations = response['Reservations']
-                print(f"Found {len(reservations)} reservations in region {region}")
-
-                for reservation in reservations:
-                    instances = reservation['Instances']
-                    for instance in instances:
-                        instance_id = instance['InstanceId']
-                        public_ip = instance.get('PublicIpAddress')
-                        public_dns = instance.get('PublicDnsName', 'N/A')
-
-                        if public_ip:  # Only include instances with a public IP
-                            ec2_data.append([account_id, region, instance_id, public_ip, public_dns])
-                            print(f"Processed instance: {instance_id} in region {region}, Public IP: {public_ip}, Public DNS: {public_dns}")
-            
-            except ClientError as e:
-                print(f"Error listing instances in region {region}: {e}")
-    
+                client = SESSION.client('ec2', region_name=region, config=REGIONAL_CLIENT_CONFIG)
+                # Let EC2 drop instances without a public IPv4 address before they are serialised.
+                # Unlike filtering on running instances, this keeps stopped instances with an Elastic IP.
+                public_ip_filter = [{'Name': 'ip-address', 'Values': ['*']}]
+                # 1000 is the largest page describe_instances will return.
+                for page in client.get_paginator('describe_instances').paginate(Filters=public_ip_filter, PaginationConfig={'PageSize': 1000}):
+                    for reservation in page['Reservations']:
+                        instances = reservation['Instances']
+                        for instance in instances:
+                            instance_id = instance['InstanceId']
+                            public_ip = instance.get('PublicIpAddress')
+                            public_dns = instance.get('PublicDnsName', 'N/A')
+
+                            if public_ip:  # Only include instances with a public IP
+                                instance_ids.append(instance_id)
+                                public_ips.append(public_ip)
+                                public_dns_names.append(public_dns)
+                                log.debug("Processed instance: %s in region %s, Public IP: %s, Public DNS: %s", instance_id, region, public_ip, public_dns)
+
+                log.info("Found %d instances with a public IP in region %s", len(instance_ids), region)
+
+            except NoCredentialsError:
+                raise
+            except (ClientError, BotoCoreError) as e:
+                log.warning("Error listing instances in region %s: %s", region, e)
+
+            return {
+                'Account ID': [account_id] * len(instance_ids),
+                'Region': [region] * len(instance_ids),
+                'Instance ID': instance_ids,
+                'Public IP': public_ips,
+                'Public DNS': public_dns_names,
+            }
+
+        ec2_data = scan_regions('ec2', scan_region)
+
     except NoRegionError:
-        print("No region found. Please configure your AWS region.")
+        log.error("No region found. Please configure your AWS region.")
     except NoCredentialsError:
-        print("No AWS credentials found. Please configure your AWS credentials.")
+        log.error("No AWS credentials found. Please configure your AWS credentials.")
     except Exception as e:
-        print(f"An error occurred: {e}")
+        log.error("An error occurred: %s", e)
 
     return ec2_data
 
 
+def enqueue_result(results, sheet_name, columns, task):
+    try:
+        data = task.result()
+    except Exception as e:
+        log.error("Collector for %s failed: %s", sheet_name, e)
+        data = {}
+
+    log.info("Collected %d rows for %s", len(data.get('Account ID', [])), sheet_name)
+    results.put((sheet_name, columns, data))
+
+def write_report(filename, results, sheet_names):
+    # Rows are written strictly in order, so constant_memory can flush each one
+    # to disk as soon as the next starts. Every value is plain text: skip the
+    # URL regex xlsxwriter would run on every URL and DNS name, and never turn
+    # a value starting with '=' into a formula.
+    workbook = xlsxwriter.Workbook(filename, {
+        'constant_memory': True,
+        'strings_to_urls': False,
+        'strings_to_formulas': False,
+    })
+    header_format = workbook.add_format({'bold': True})
+
+    # Sheets are filled in whatever order the collectors finish, so create
+    # them all up front to keep the workbook's sheet order fixed.
+    worksheets = {sheet_name: workbook.add_worksheet(sheet_name) for sheet_name in sheet_names}
+
+    for _ in sheet_names:
+        result = results.get()
+        if result is None:
+            # The run was interrupted before every collector finished; don't
+            # leave a report behind that looks complete but isn't.
+            workbook.close()
+            os.remove(filename)
+            return
+
+        sheet_name, columns, data = result
+        worksheet = worksheets[sheet_name]
+        worksheet.write_row(0, 0, columns, header_format)
+
+        rows = zip(*(data.get(column, []) for column in columns))
+        for row_number, row in enumerate(rows, 1):
+            worksheet.write_row(row_number, 0, row)
+
+    workbook.close()
+    log.info("Data written to %s", filename)
+
+# Sheet name, collector and column headers for each sheet of the report.
+COLLECTORS = [
+    ('Route 53 DNS Records', list_route53_records, ['Account ID', 'Hosted Zone', 'Domain', 'Record Type', 'Record Value']),
+    ('API Gateway Endpoints', get_api_gateway_endpoints, ['Account ID', 'Region', 'API Name', 'API ID', 'Stage', 'Invoke URL']),
+    ('Lambda Functions', get_lambda_functions, ['Account ID', 'Region', 'Function Name', 'Function URL']),
+    ('AppSync Endpoints', get_appsync_endpoints, ['Account ID', 'Region', 'API Name', 'API URL']),
+    ('CloudFront Distributions', get_cloudfront_endpoints, ['Account ID', 'Distribution ID', 'Distribution Name', 'Domain Name', 'Alternate Domain Names']),
+    ('Amplify Apps', get_amplify_endpoints, ['Account ID', 'Region', 'App ID', 'App Name', 'Branch Name', 'Branch URL']),
+    ('ELB Endpoints', get_elb_endpoints, ['Account ID', 'Region', 'Load Balancer Name', 'DNS Name']),
+    ('RDS Endpoints', get_rds_endpoints, ['Account ID', 'Region', 'DB Instance ID', 'Endpoint']),
+    ('EC2 Instances', get_ec2_endpoints, ['Account ID', 'Region', 'Instance ID', 'Public IP', 'Public DNS']),
+]
 
 if __name__ == "__main__":
+    # Keep third-party loggers at WARNING; only this script's progress is logged at INFO.
+    logging.basicConfig(format='%(levelname)s %(message)s')
+    log.setLevel(logging.DEBUG if VERBOSE else logging.INFO)
     account_id = get_aws_account_id()
     
     if account_id:
-        dns_records_data = list_route53_records(account_id)
-        dns_df = pd.DataFrame(dns_records_data, columns=['Account ID', 'Hosted Zone', 'Domain', 'Record Type', 'Record Value'])
-        
-        api_endpoints_data = get_api_gateway_endpoints(account_id)
-        api_df = pd.DataFrame(api_endpoints_data, columns=['Account ID', 'Region', 'API Name', 'API ID', 'Stage', 'Invoke URL'])
-        
-        lambda_data = get_lambda_functions(account_id)
-        print(f"Collected Lambda data: {lambda_data}")  # Debugging line
-        lambda_df = pd.DataFrame(lambda_data, columns=['Account ID', 'Region', 'Function Name', 'Function URL'])
-        
-        appsync_data = get_appsync_endpoints(account_id)
-        print(f"Collected AppSync data: {appsync_data}")  # Debugging line
-        appsync_df = pd.DataFrame(appsync_data, columns=['Account ID', 'Region', 'API Name', 'API URL'])
-
-        cloudfront_data = get_cloudfront_endpoints(account_id)
-        print(f"Collected CloudFront data: {cloudfront_data}")  # Debugging line
-        cloudfront_df = pd.DataFrame(cloudfront_data, columns=['Account ID', 'Distribution ID', 'Distribution Name', 'Domain Name', 'Alternate Domain Names'])
-
-        amplify_data = get_amplify_endpoints(account_id)
-        print(f"Collected Amplify data: {amplify_data}")  # Debugging line
-        amplify_df = pd.DataFrame(amplify_data, columns=['Account ID', 'Region', 'App ID', 'App Name', 'Branch Name', 'Branch URL'])
-
-        elb_data = get_elb_endpoints(account_id)
-        print(f"Collected ELB data: {elb_data}")  # Debugging line
-        elb_df = pd.DataFrame(elb_data, columns=['Account ID', 'Region', 'Load Balancer Name', 'DNS Name'])
-
-        rds_data = get_rds_endpoints(account_id)
-        print(f"Collected RDS data: {rds_data}")  # Debugging line
-        rds_df = pd.DataFrame(rds_data, columns=['Account ID', 'Region', 'DB Instance ID', 'Endpoint'])
-
-        ec2_data = get_ec2_endpoints(account_id)
-        print(f"Collected EC2 data: {ec2_data}")  # Debugging line
-        ec2_df = pd.DataFrame(ec2_data, columns=['Account ID', 'Region', 'Instance ID', 'Public IP', 'Public DNS'])
+        # Resolve the enabled regions once, before the collectors all ask for them.
+        get_enabled_regions()
+        if TAGGED_REGIONS_ONLY:
+            get_tagged_regions()
 
         timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
         filename = f"aws_resources_{account_id}_{timestamp}.xlsx"
 
-        with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-            dns_df.to_excel(writer, sheet_name='Route 53 DNS Records', index=False)
-            api_df.to_excel(writer, sheet_name='API Gateway Endpoints', index=False)
-            lambda_df.to_excel(writer, sheet_name='Lambda Functions', index=False)
-            appsync_df.to_excel(writer, sheet_name='AppSync Endpoints', index=False)
-            cloudfront_df.to_excel(writer, sheet_name='CloudFront Distributions', index=False)
-            amplify_df.to_excel(writer, sheet_name='Amplify Apps', index=False)
-            elb_df.to_excel(writer, sheet_name='ELB Endpoints', index=False)
-            rds_df.to_excel(writer, sheet_name='RDS Endpoints', index=False)
-            ec2_df.to_excel(writer, sheet_name='EC2 Instances', index=False)
-        
-        print(f"Data written to {filename}")
+        # Write each sheet as soon as its collector finishes, while the slower
+        # collectors are still waiting on the network.
+        results = queue.Queue()
+        sheet_names = [sheet_name for sheet_name, _, _ in COLLECTORS]
+        # Leaving the writer's block waits for it, even when interrupted, so an
+        # incomplete workbook is always removed before the process exits.
+        with ThreadPoolExecutor(max_workers=1) as writer:
+            report = writer.submit(write_report, filename, results, sheet_names)
+
+            # The collectors are independent and I/O bound, so run them all at once.
+            try:
+                with ThreadPoolExecutor(max_workers=len(COLLECTORS)) as executor:
+                    for sheet_name, collector, columns in COLLECTORS:
+                        task = executor.submit(collector, account_id)
+                        task.add_done_callback(partial(enqueue_result, results, sheet_name, columns))
+            finally:
+                # Wake the writer if the collectors were interrupted. After a normal
+                # run every sheet is already queued ahead of this, so it is never read.
+                results.put(None)
+
+        # Re-raise a failed write so the run exits non-zero.
+        report.result()
     else:
-        print("Failed to retrieve AWS account ID.")
+        log.error("Failed to retrieve AWS account ID.")